@@ -9,16 +9,34 @@ import json
 import os
 import sys
 import time
-import subprocess
+from typing import NamedTuple
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+RUNTIME_DIR = os.path.join(SCRIPT_DIR, "runtime")
 CONFIG_PATH = os.path.join(SCRIPT_DIR, "games_config.json")
-STATE_FILE = os.path.join(SCRIPT_DIR, "game_state")
-PID_FILE = os.path.join(SCRIPT_DIR, "watcher.pid")
+STATE_FILE = os.path.join(RUNTIME_DIR, "game_state")
+PID_FILE = os.path.join(RUNTIME_DIR, "watcher.pid")
 ICONS_DIR = os.path.join(SCRIPT_DIR, "icons")
 
+# The watcher writes its state here; the folder must exist to be watched
+os.makedirs(RUNTIME_DIR, exist_ok=True)
+
+# Parsed config cache, keyed on the file's (mtime_ns, size). "saved" is the
+# serialized form last read or written, so unchanged configs are never
+# rewritten.
+_cfg_cache = {"stamp": None, "data": None, "saved": None}
+
 # Windows API
 TH32CS_SNAPPROCESS = 0x00000002
+SYNCHRONIZE = 0x00100000
+WATCHER_MUTEX_NAME = "Local\\OBSGameWatcher"
+INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+FILE_NOTIFY_CHANGE_FILE_NAME = 0x00000001
+FILE_NOTIFY_CHANGE_LAST_WRITE = 0x00000010
+WAIT_OBJECT_0 = 0x00000000
+WAIT_TIMEOUT = 0x00000102
+DETACHED_PROCESS = 0x00000008
+CREATE_NEW_PROCESS_GROUP = 0x00000200
 
 class PROCESSENTRY32W(ctypes.Structure):
     _fields_ = [
@@ -34,59 +52,173 @@ class PROCESSENTRY32W(ctypes.Structure):
         ('szExeFile', wintypes.WCHAR * 260),
     ]
 
+class STARTUPINFOW(ctypes.Structure):
+    _fields_ = [
+        ('cb', wintypes.DWORD),
+        ('lpReserved', wintypes.LPWSTR),
+        ('lpDesktop', wintypes.LPWSTR),
+        ('lpTitle', wintypes.LPWSTR),
+        ('dwX', wintypes.DWORD),
+        ('dwY', wintypes.DWORD),
+        ('dwXSize', wintypes.DWORD),
+        ('dwYSize', wintypes.DWORD),
+        ('dwXCountChars', wintypes.DWORD),
+        ('dwYCountChars', wintypes.DWORD),
+        ('dwFillAttribute', wintypes.DWORD),
+        ('dwFlags', wintypes.DWORD),
+        ('wShowWindow', wintypes.WORD),
+        ('cbReserved2', wintypes.WORD),
+        ('lpReserved2', ctypes.POINTER(wintypes.BYTE)),
+        ('hStdInput', wintypes.HANDLE),
+        ('hStdOutput', wintypes.HANDLE),
+        ('hStdError', wintypes.HANDLE),
+    ]
+
+class PROCESS_INFORMATION(ctypes.Structure):
+    _fields_ = [
+        ('hProcess', wintypes.HANDLE),
+        ('hThread', wintypes.HANDLE),
+        ('dwProcessId', wintypes.DWORD),
+        ('dwThreadId', wintypes.DWORD),
+    ]
+
 user32 = ctypes.windll.user32
 kernel32 = ctypes.windll.kernel32
+# Separate kernel32 handle with use_last_error, so ctypes saves GetLastError
+# right after CreateProcessW returns
+kernel32_le = ctypes.WinDLL('kernel32', use_last_error=True)
 
 EnumWindows = user32.EnumWindows
 EnumWindowsProc = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
 GetWindowTextW = user32.GetWindowTextW
-GetWindowTextLengthW = user32.GetWindowTextLengthW
 IsWindowVisible = user32.IsWindowVisible
 GetWindowThreadProcessId = user32.GetWindowThreadProcessId
 CreateToolhelp32Snapshot = kernel32.CreateToolhelp32Snapshot
 Process32FirstW = kernel32.Process32FirstW
 Process32NextW = kernel32.Process32NextW
 CloseHandle = kernel32.CloseHandle
+OpenProcess = kernel32.OpenProcess
+TerminateProcess = kernel32.TerminateProcess
+OpenMutexW = kernel32.OpenMutexW
+FindFirstChangeNotificationW = kernel32.FindFirstChangeNotificationW
+FindNextChangeNotification = kernel32.FindNextChangeNotification
+FindCloseChangeNotification = kernel32.FindCloseChangeNotification
+WaitForSingleObject = kernel32.WaitForSingleObject
+CreateProcessW = kernel32_le.CreateProcessW
+
+EnumWindows.argtypes = [EnumWindowsProc, ctypes.py_object]
+EnumWindows.restype = wintypes.BOOL
+GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+GetWindowTextW.restype = ctypes.c_int
+IsWindowVisible.argtypes = [wintypes.HWND]
+IsWindowVisible.restype = wintypes.BOOL
+GetWindowThreadProcessId.argtypes = [wintypes.HWND, wintypes.LPDWORD]
+GetWindowThreadProcessId.restype = wintypes.DWORD
+
+CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+Process32FirstW.restype = wintypes.BOOL
+Process32NextW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+Process32NextW.restype = wintypes.BOOL
+CloseHandle.argtypes = [wintypes.HANDLE]
+CloseHandle.restype = wintypes.BOOL
+OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+OpenProcess.restype = wintypes.HANDLE
+TerminateProcess.argtypes = [wintypes.HANDLE, wintypes.UINT]
+TerminateProcess.restype = wintypes.BOOL
+OpenMutexW.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.LPCWSTR]
+OpenMutexW.restype = wintypes.HANDLE
+FindFirstChangeNotificationW.argtypes = [wintypes.LPCWSTR, wintypes.BOOL, wintypes.DWORD]
+FindFirstChangeNotificationW.restype = wintypes.HANDLE
+FindNextChangeNotification.argtypes = [wintypes.HANDLE]
+FindNextChangeNotification.restype = wintypes.BOOL
+FindCloseChangeNotification.argtypes = [wintypes.HANDLE]
+FindCloseChangeNotification.restype = wintypes.BOOL
+WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+WaitForSingleObject.restype = wintypes.DWORD
+CreateProcessW.argtypes = [
+    wintypes.LPCWSTR, wintypes.LPWSTR, wintypes.LPVOID, wintypes.LPVOID,
+    wintypes.BOOL, wintypes.DWORD, wintypes.LPVOID, wintypes.LPCWSTR,
+    ctypes.POINTER(STARTUPINFOW), ctypes.POINTER(PROCESS_INFORMATION),
+]
+CreateProcessW.restype = wintypes.BOOL
+
+# The EnumWindows callback is a module-level thunk created once; per-call
+# state is passed through LPARAM as a py_object instead of a closure.
+def enum_state(lparam):
+    return ctypes.cast(lparam, ctypes.py_object).value
+
+
+# Reused for every window title instead of allocating one per window
+TITLE_BUF_LEN = 512
+_TITLE_BUF = ctypes.create_unicode_buffer(TITLE_BUF_LEN)
 
 
 def load_config():
     try:
         if os.path.exists(CONFIG_PATH):
+            st = os.stat(CONFIG_PATH)
+            stamp = (st.st_mtime_ns, st.st_size)
+            if stamp == _cfg_cache["stamp"] and _cfg_cache["data"] is not None:
+                return _cfg_cache["data"]
+
             with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
-                return json.load(f)
+                config = json.load(f)
+            _cfg_cache["stamp"] = stamp
+            _cfg_cache["data"] = config
+            _cfg_cache["saved"] = json.dumps(config, separators=(',', ':'))
+            return config
     except:
         pass
     return {"games": []}
 
 
 def save_config(config):
-    with open(CONFIG_PATH, 'w', encoding='utf-8') as f:
-        json.dump(config, f, indent=2)
+    serialized = json.dumps(config, separators=(',', ':'))
+    if serialized == _cfg_cache["saved"] and os.path.exists(CONFIG_PATH):
+        return
+
+    # Atomic swap via a temp file
+    _cfg_cache["stamp"] = None
+    tmp = CONFIG_PATH + ".tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write(serialized)
+    os.replace(tmp, CONFIG_PATH)
+    st = os.stat(CONFIG_PATH)
+    _cfg_cache["stamp"] = (st.st_mtime_ns, st.st_size)
+    _cfg_cache["data"] = config
+    _cfg_cache["saved"] = serialized
+
+
+class VisibleWindows(NamedTuple):
+    titles: list
+    pids: list
+
+
+@EnumWindowsProc
+def _collect_windows_proc(hwnd, lparam):
+    titles, pids = enum_state(lparam)
+    if IsWindowVisible(hwnd):
+        length = GetWindowTextW(hwnd, _TITLE_BUF, TITLE_BUF_LEN)
+        if length > 0:
+            pid = wintypes.DWORD()
+            GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+            titles.append(_TITLE_BUF[:length])
+            pids.append(pid.value)
+    return True
 
 
 def get_visible_windows():
-    windows = []
-
-    def callback(hwnd, lparam):
-        if IsWindowVisible(hwnd):
-            length = GetWindowTextLengthW(hwnd)
-            if length > 0:
-                buffer = ctypes.create_unicode_buffer(length + 1)
-                GetWindowTextW(hwnd, buffer, length + 1)
-                if buffer.value:
-                    pid = wintypes.DWORD()
-                    GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
-                    windows.append({'title': buffer.value, 'pid': pid.value})
-        return True
-
-    EnumWindows(EnumWindowsProc(callback), 0)
+    windows = VisibleWindows([], [])
+    EnumWindows(_collect_windows_proc, windows)
     return windows
 
 
 def get_process_list():
     processes = {}
     snapshot = CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
-    if snapshot == -1:
+    if snapshot == INVALID_HANDLE_VALUE:
         return processes
 
     try:
@@ -103,18 +235,22 @@ def get_process_list():
 
 
 def is_watcher_running():
-    if os.path.exists(PID_FILE):
-        try:
-            with open(PID_FILE, 'r') as f:
-                pid = int(f.read().strip())
-            PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
-            handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
-            if handle:
-                kernel32.CloseHandle(handle)
-                return True, pid
-        except:
-            pass
-    return False, None
+    """
+    The watcher holds a named mutex while alive, so this can't be fooled
+    by a reused PID. The PID file is only read for display.
+    """
+    handle = OpenMutexW(SYNCHRONIZE, False, WATCHER_MUTEX_NAME)
+    if not handle:
+        return False, None
+    CloseHandle(handle)
+
+    pid = None
+    try:
+        with open(PID_FILE, 'r') as f:
+            pid = int(f.read().strip())
+    except:
+        pass
+    return True, pid
 
 
 def start_watcher():
@@ -123,11 +259,23 @@ def start_watcher():
         print(f"  Watcher already running (PID: {pid})")
         return
 
+    # Spawn pythonw fully detached - no stdio, nothing to inherit
     watcher_path = os.path.join(SCRIPT_DIR, "game_watcher.pyw")
-    subprocess.Popen(
-        ["pythonw", watcher_path],
-        creationflags=subprocess.CREATE_NO_WINDOW
-    )
+    cmdline = ctypes.create_unicode_buffer(f'pythonw.exe "{watcher_path}"')
+    startup = STARTUPINFOW()
+    startup.cb = ctypes.sizeof(STARTUPINFOW)
+    info = PROCESS_INFORMATION()
+
+    if not CreateProcessW(
+        None, cmdline, None, None, False,
+        DETACHED_PROCESS | CREATE_NEW_PROCESS_GROUP,
+        None, SCRIPT_DIR, ctypes.byref(startup), ctypes.byref(info)
+    ):
+        print(f"  Failed to start watcher (error {ctypes.get_last_error()})")
+        return
+
+    CloseHandle(info.hThread)
+    CloseHandle(info.hProcess)
     time.sleep(0.5)
 
     running, pid = is_watcher_running()
@@ -142,10 +290,13 @@ def stop_watcher():
     if not running:
         print("  Watcher not running")
         return
+    if pid is None:
+        print("  Watcher PID unknown - stop it from Task Manager")
+        return
 
     try:
-        kernel32.TerminateProcess(
-            kernel32.OpenProcess(1, False, pid), 0
+        TerminateProcess(
+            OpenProcess(1, False, pid), 0
         )
         if os.path.exists(PID_FILE):
             os.remove(PID_FILE)
@@ -169,29 +320,29 @@ def list_windows():
     windows = get_visible_windows()
     procs = get_process_list()
 
-    for i, w in enumerate(windows, 1):
-        proc = procs.get(w['pid'], 'unknown')
-        print(f"  {i:3}. [{proc}] {w['title']}")
+    for i, (title, pid) in enumerate(zip(windows.titles, windows.pids), 1):
+        proc = procs.get(pid, 'unknown')
+        print(f"  {i:3}. [{proc}] {title}")
 
-    print(f"\n  Total: {len(windows)}")
+    print(f"\n  Total: {len(windows.titles)}")
     return windows
 
 
 def search_windows(term):
     print(f"\n=== SEARCH: '{term}' ===\n")
-    windows = get_visible_windows()
+    titles, pids = get_visible_windows()
     procs = get_process_list()
     term_lower = term.lower()
 
     matches = []
-    for w in windows:
-        proc = procs.get(w['pid'], '')
-        if term_lower in w['title'].lower() or term_lower in proc:
-            matches.append((w, proc))
+    for title, pid in zip(titles, pids):
+        proc = procs.get(pid, '')
+        if term_lower in title.lower() or term_lower in proc:
+            matches.append((title, proc))
 
     if matches:
-        for w, proc in matches:
-            print(f"  [{proc}] {w['title']}")
+        for title, proc in matches:
+            print(f"  [{proc}] {title}")
     else:
         print("  No matches.")
 
@@ -305,9 +456,37 @@ def show_status():
     print(f"  Games: {enabled}/{total} enabled")
 
 
+def watch_state_dir():
+    """Change-notification handle for the state file's folder, or None."""
+    handle = FindFirstChangeNotificationW(
+        os.path.dirname(STATE_FILE), False,
+        FILE_NOTIFY_CHANGE_FILE_NAME | FILE_NOTIFY_CHANGE_LAST_WRITE
+    )
+    if not handle or handle == INVALID_HANDLE_VALUE:
+        return None
+    return handle
+
+
+def wait_for_change(handle):
+    """
+    Block until something in the watched folder changes.
+    Waits in short slices so Ctrl+C is still picked up.
+    """
+    while True:
+        result = WaitForSingleObject(handle, 500)
+        if result == WAIT_OBJECT_0:
+            return FindNextChangeNotification(handle)
+        if result != WAIT_TIMEOUT:
+            return False
+
+
 def monitor_state(interval=1):
     print("\n=== MONITORING STATE ===")
-    print(f"  Interval: {interval}s")
+    handle = watch_state_dir()
+    if handle:
+        print("  Waiting for state file changes")
+    else:
+        print(f"  Interval: {interval}s")
     print("  Press Ctrl+C to stop\n")
 
     last = ""
@@ -320,9 +499,18 @@ def monitor_state(interval=1):
                 print(f"  [{ts}] {state or 'NO STATE'}")
                 last = state
 
-            time.sleep(interval)
+            if handle and not wait_for_change(handle):
+                # Notifications stopped working - fall back to polling
+                FindCloseChangeNotification(handle)
+                handle = None
+
+            if not handle:
+                time.sleep(interval)
     except KeyboardInterrupt:
         print("\n  Stopped.")
+    finally:
+        if handle:
+            FindCloseChangeNotification(handle)
 
 
 def main_menu():
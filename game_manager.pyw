@@ -44,6 +44,8 @@ VK_TO_NAME = {v: k for k, v in VK_CODES.items()}
 
 # Windows API
 TH32CS_SNAPPROCESS = 0x00000002
+SYNCHRONIZE = 0x00100000
+WATCHER_MUTEX_NAME = "Local\\OBSGameWatcher"
 
 class PROCESSENTRY32W(ctypes.Structure):
     _fields_ = [
@@ -72,6 +74,9 @@ CreateToolhelp32Snapshot = kernel32.CreateToolhelp32Snapshot
 Process32FirstW = kernel32.Process32FirstW
 Process32NextW = kernel32.Process32NextW
 CloseHandle = kernel32.CloseHandle
+OpenMutexW = kernel32.OpenMutexW
+OpenMutexW.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.LPCWSTR]
+OpenMutexW.restype = wintypes.HANDLE
 
 
 # ============== Config Functions ==============
@@ -218,17 +223,22 @@ def get_process_list():
 
 
 def is_watcher_running():
-    if os.path.exists(PID_FILE):
-        try:
-            with open(PID_FILE, 'r') as f:
-                pid = int(f.read().strip())
-            handle = kernel32.OpenProcess(0x1000, False, pid)
-            if handle:
-                kernel32.CloseHandle(handle)
-                return True, pid
-        except:
-            pass
-    return False, None
+    """
+    The watcher holds a named mutex while alive, so this can't be fooled
+    by a reused PID. The PID file is only read for display.
+    """
+    handle = OpenMutexW(SYNCHRONIZE, False, WATCHER_MUTEX_NAME)
+    if not handle:
+        return False, None
+    CloseHandle(handle)
+
+    pid = None
+    try:
+        with open(PID_FILE, 'r') as f:
+            pid = int(f.read().strip())
+    except:
+        pass
+    return True, pid
 
 
 def get_watcher_state():
@@ -613,6 +623,12 @@ Example:
         running, pid = is_watcher_running()
         if not running:
             return
+        if pid is None:
+            # Alive per the mutex, but there is no PID file to stop it by
+            messagebox.showwarning(
+                "Warning", "Watcher is running but its PID is unknown.\n"
+                           "Stop it from Task Manager.")
+            return
 
         try:
             kernel32.TerminateProcess(kernel32.OpenProcess(1, False, pid), 0)
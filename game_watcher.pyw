@@ -53,6 +53,12 @@ def log(message):
 
 # Windows API constants
 TH32CS_SNAPPROCESS = 0x00000002
+ERROR_ALREADY_EXISTS = 183
+
+# Named mutex held for the watcher's lifetime; the manager checks it to see
+# whether the watcher is alive (the PID file is only used for display).
+WATCHER_MUTEX_NAME = "Local\\OBSGameWatcher"
+instance_mutex = None
 
 class PROCESSENTRY32W(ctypes.Structure):
     _fields_ = [
@@ -84,6 +90,13 @@ Process32FirstW = kernel32.Process32FirstW
 Process32NextW = kernel32.Process32NextW
 CloseHandle = kernel32.CloseHandle
 
+# Separate kernel32 handle with use_last_error, so ctypes saves GetLastError
+# right after CreateMutexW returns
+kernel32_le = ctypes.WinDLL('kernel32', use_last_error=True)
+CreateMutexW = kernel32_le.CreateMutexW
+CreateMutexW.argtypes = [wintypes.LPVOID, wintypes.BOOL, wintypes.LPCWSTR]
+CreateMutexW.restype = wintypes.HANDLE
+
 
 def load_config():
     """Load games configuration."""
@@ -611,21 +624,18 @@ def write_pid():
 
 
 def check_already_running():
-    """Check if another instance is running."""
-    if os.path.exists(PID_FILE):
-        try:
-            with open(PID_FILE, 'r') as f:
-                old_pid = int(f.read().strip())
-
-            # Check if process exists
-            kernel32 = ctypes.windll.kernel32
-            PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
-            handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, old_pid)
-            if handle:
-                kernel32.CloseHandle(handle)
-                return True  # Still running
-        except:
-            pass
+    """
+    Check if another instance is running.
+    Creates the named mutex that marks this watcher as alive; Windows
+    releases it when the process exits, however it exits.
+    """
+    global instance_mutex
+
+    instance_mutex = CreateMutexW(None, True, WATCHER_MUTEX_NAME)
+    if instance_mutex and ctypes.get_last_error() == ERROR_ALREADY_EXISTS:
+        CloseHandle(instance_mutex)
+        instance_mutex = None
+        return True  # Still running
 
     return False
 
@@ -6,9 +6,15 @@ Uses lightweight Windows API calls instead of spawning WMIC/PowerShell.
 
 import ctypes
 import ctypes.wintypes as wintypes
+import functools
+import hashlib
 import json
 import os
+import queue
 import re
+import threading
+import time
+from typing import NamedTuple
 
 # Try to import obspython (only available when running in OBS)
 try:
@@ -18,6 +24,22 @@ except ImportError:
     IN_OBS = False
     obs = None
 
+# orjson parses/serializes in C when it is installed; stdlib json otherwise.
+# Both produce the same compact UTF-8 JSON, so the other tools reading
+# games_config.json are unaffected.
+try:
+    import orjson
+
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    orjson = None
+
+    json_loads = json.loads
+
+    def json_dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
 # Script directory and config path
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_PATH = os.path.join(SCRIPT_DIR, "games_config.json")
@@ -25,47 +47,237 @@ ICONS_DIR = os.path.join(SCRIPT_DIR, "icons")
 
 # Script settings
 check_interval = 3000  # milliseconds (default higher for less load)
+min_interval = 500     # polling rate while recording
+max_interval = 8000    # cap for the idle backoff
 is_recording_for_game = False
 current_game = None
+current_game_hwnd = None
+current_game_pid = None
 games_config = {"games": []}
 current_settings = None
+info_logging = True    # LOG_INFO messages; warnings/errors are always logged
+
+# Parsed config cache, keyed on the file's (mtime_ns, size). "hash" is a
+# digest of the serialized config last read or written, so unchanged saves
+# are skipped.
+_cfg_cache = {"stamp": None, "data": None, "hash": None}
+_save_pending = False
+
+# Config reads/writes and the index rebuilds that follow them also run on
+# the icon worker thread; both share one config file, so they are serialized.
+# Reentrant because load_config creates a missing file through save_config.
+_config_lock = threading.RLock()
+
+# One alternation over all enabled selectors, rebuilt whenever the config
+# changes. Each selector gets a named group (g0, g1, ...) mapping back to
+# its game so a single search per window title finds the game.
+_selector_pattern = None
+_selector_to_game = {}
+
+# All games (enabled or not) by lowercased selector, for O(1) lookups from
+# the add/remove/toggle paths. Rebuilt together with the pattern.
+_games_by_selector = {}
+_selectors_lower = frozenset()
+
+# Subset of the above for selectors that look like exe names. When it is
+# None, no PID ever needs its exe name resolved.
+_exe_selector_pattern = None
+
+# Whether any enabled selector literally ends in ".exe". Only those are
+# assumed to never show up in a window title (see full_scan_due).
+_has_exe_file_selectors = False
+
+# Complete exe-name selectors ("game.exe") mapped to the group the exe
+# pattern itself picks for that exact name - an earlier selector such as
+# "game" can win - so an exact process name resolves with one dict lookup
+# and the same result as a regex search.
+_exe_name_to_group = {}
+
+# (setting name, label) per game for the properties list, reused while the
+# games list is unchanged. OBS frees the properties object it is handed, so
+# only the derived rows are kept, never the handle itself.
+_props_rows_key = None
+_props_rows = []
+
+# Filename sanitizer for extracted icons
+_SAFE_NAME_RE = re.compile(r'[^\w\-]')
+
+# Windows the Detect button should skip over: shell/system surfaces and
+# common non-game apps
+_SYS_TITLE_RE = re.compile('|'.join(map(re.escape, [
+    'program manager', 'settings', 'task manager', 'obs'])))
+_SYS_PROCS = frozenset([
+    'explorer.exe', 'cmd.exe', 'powershell.exe', 'code.exe',
+    'chrome.exe', 'firefox.exe', 'msedge.exe', 'obs64.exe', 'obs32.exe',
+    'searchhost.exe', 'textinputhost.exe', 'shellexperiencehost.exe'])
 
 # Windows API constants
 PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
-TH32CS_SNAPPROCESS = 0x00000002
+SYNCHRONIZE = 0x00100000
+SYSTEM_PROCESS_INFORMATION_CLASS = 5
+STATUS_INFO_LENGTH_MISMATCH = 0xC0000004
+EVENT_SYSTEM_FOREGROUND = 0x0003
+EVENT_OBJECT_SHOW = 0x8002
+OBJID_WINDOW = 0
+CHILDID_SELF = 0
+GA_ROOT = 2
+WINEVENT_OUTOFCONTEXT = 0x0000
+WINEVENT_SKIPOWNPROCESS = 0x0002
+WM_QUIT = 0x0012
+WT_EXECUTEONLYONCE = 0x00000008
+INFINITE = 0xFFFFFFFF
+INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+GW_OWNER = 4
+GWL_EXSTYLE = -20
+WS_EX_TOOLWINDOW = 0x00000080
 
 # Windows API structures
-class PROCESSENTRY32W(ctypes.Structure):
+class UNICODE_STRING(ctypes.Structure):
+    _fields_ = [
+        ('Length', wintypes.USHORT),
+        ('MaximumLength', wintypes.USHORT),
+        ('Buffer', ctypes.c_void_p),
+    ]
+
+# Leading fields of SYSTEM_PROCESS_INFORMATION - only up to the PID is read
+class SYSTEM_PROCESS_INFORMATION(ctypes.Structure):
     _fields_ = [
-        ('dwSize', wintypes.DWORD),
-        ('cntUsage', wintypes.DWORD),
-        ('th32ProcessID', wintypes.DWORD),
-        ('th32DefaultHeapID', ctypes.POINTER(ctypes.c_ulong)),
-        ('th32ModuleID', wintypes.DWORD),
-        ('cntThreads', wintypes.DWORD),
-        ('th32ParentProcessID', wintypes.DWORD),
-        ('pcPriClassBase', ctypes.c_long),
-        ('dwFlags', wintypes.DWORD),
-        ('szExeFile', wintypes.WCHAR * 260),
+        ('NextEntryOffset', wintypes.ULONG),
+        ('NumberOfThreads', wintypes.ULONG),
+        ('WorkingSetPrivateSize', ctypes.c_longlong),
+        ('HardFaultCount', wintypes.ULONG),
+        ('NumberOfThreadsHighWatermark', wintypes.ULONG),
+        ('CycleTime', ctypes.c_ulonglong),
+        ('CreateTime', ctypes.c_longlong),
+        ('UserTime', ctypes.c_longlong),
+        ('KernelTime', ctypes.c_longlong),
+        ('ImageName', UNICODE_STRING),
+        ('BasePriority', wintypes.LONG),
+        ('UniqueProcessId', ctypes.c_void_p),
     ]
 
 # Load Windows DLLs
 user32 = ctypes.windll.user32
 kernel32 = ctypes.windll.kernel32
-psapi = ctypes.windll.psapi
+ntdll = ctypes.windll.ntdll
+shell32 = ctypes.windll.shell32
 
 # Define function signatures
 EnumWindows = user32.EnumWindows
 EnumWindowsProc = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
 GetWindowTextW = user32.GetWindowTextW
-GetWindowTextLengthW = user32.GetWindowTextLengthW
 IsWindowVisible = user32.IsWindowVisible
 GetWindowThreadProcessId = user32.GetWindowThreadProcessId
-
-CreateToolhelp32Snapshot = kernel32.CreateToolhelp32Snapshot
-Process32FirstW = kernel32.Process32FirstW
-Process32NextW = kernel32.Process32NextW
+IsWindow = user32.IsWindow
+GetWindow = user32.GetWindow
+GetWindowLongW = user32.GetWindowLongW
+GetForegroundWindow = user32.GetForegroundWindow
+
+EnumWindows.argtypes = [EnumWindowsProc, ctypes.py_object]
+EnumWindows.restype = wintypes.BOOL
+GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+GetWindowTextW.restype = ctypes.c_int
+IsWindowVisible.argtypes = [wintypes.HWND]
+IsWindowVisible.restype = wintypes.BOOL
+GetWindowThreadProcessId.argtypes = [wintypes.HWND, wintypes.LPDWORD]
+GetWindowThreadProcessId.restype = wintypes.DWORD
+IsWindow.argtypes = [wintypes.HWND]
+IsWindow.restype = wintypes.BOOL
+GetWindow.argtypes = [wintypes.HWND, wintypes.UINT]
+GetWindow.restype = wintypes.HWND
+GetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int]
+GetWindowLongW.restype = wintypes.LONG
+GetForegroundWindow.argtypes = []
+GetForegroundWindow.restype = wintypes.HWND
+
+NtQuerySystemInformation = ntdll.NtQuerySystemInformation
 CloseHandle = kernel32.CloseHandle
+OpenProcess = kernel32.OpenProcess
+QueryFullProcessImageNameW = kernel32.QueryFullProcessImageNameW
+GetProcessTimes = kernel32.GetProcessTimes
+GetCurrentThreadId = kernel32.GetCurrentThreadId
+RegisterWaitForSingleObject = kernel32.RegisterWaitForSingleObject
+UnregisterWaitEx = kernel32.UnregisterWaitEx
+
+WinEventProc = ctypes.WINFUNCTYPE(
+    None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+    wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD
+)
+WaitOrTimerCallback = ctypes.WINFUNCTYPE(None, wintypes.LPVOID, wintypes.BOOLEAN)
+SetWinEventHook = user32.SetWinEventHook
+UnhookWinEvent = user32.UnhookWinEvent
+GetMessageW = user32.GetMessageW
+TranslateMessage = user32.TranslateMessage
+DispatchMessageW = user32.DispatchMessageW
+PostThreadMessageW = user32.PostThreadMessageW
+GetAncestor = user32.GetAncestor
+
+NtQuerySystemInformation.argtypes = [wintypes.ULONG, wintypes.LPVOID, wintypes.ULONG, ctypes.POINTER(wintypes.ULONG)]
+NtQuerySystemInformation.restype = wintypes.LONG
+CloseHandle.argtypes = [wintypes.HANDLE]
+CloseHandle.restype = wintypes.BOOL
+OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+OpenProcess.restype = wintypes.HANDLE
+QueryFullProcessImageNameW.argtypes = [wintypes.HANDLE, wintypes.DWORD, wintypes.LPWSTR, wintypes.PDWORD]
+QueryFullProcessImageNameW.restype = wintypes.BOOL
+GetProcessTimes.argtypes = [wintypes.HANDLE] + [ctypes.POINTER(wintypes.FILETIME)] * 4
+GetProcessTimes.restype = wintypes.BOOL
+GetCurrentThreadId.argtypes = []
+GetCurrentThreadId.restype = wintypes.DWORD
+RegisterWaitForSingleObject.argtypes = [
+    ctypes.POINTER(wintypes.HANDLE), wintypes.HANDLE, WaitOrTimerCallback,
+    wintypes.LPVOID, wintypes.ULONG, wintypes.ULONG
+]
+RegisterWaitForSingleObject.restype = wintypes.BOOL
+UnregisterWaitEx.argtypes = [wintypes.HANDLE, wintypes.HANDLE]
+UnregisterWaitEx.restype = wintypes.BOOL
+SetWinEventHook.argtypes = [
+    wintypes.UINT, wintypes.UINT, wintypes.HMODULE, WinEventProc,
+    wintypes.DWORD, wintypes.DWORD, wintypes.UINT
+]
+SetWinEventHook.restype = wintypes.HANDLE
+UnhookWinEvent.argtypes = [wintypes.HANDLE]
+UnhookWinEvent.restype = wintypes.BOOL
+GetMessageW.argtypes = [ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT]
+GetMessageW.restype = ctypes.c_int
+TranslateMessage.argtypes = [ctypes.POINTER(wintypes.MSG)]
+TranslateMessage.restype = wintypes.BOOL
+DispatchMessageW.argtypes = [ctypes.POINTER(wintypes.MSG)]
+DispatchMessageW.restype = wintypes.LPARAM
+PostThreadMessageW.argtypes = [wintypes.DWORD, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+PostThreadMessageW.restype = wintypes.BOOL
+GetAncestor.argtypes = [wintypes.HWND, wintypes.UINT]
+GetAncestor.restype = wintypes.HWND
+
+ExtractIconExW = shell32.ExtractIconExW
+DestroyIcon = user32.DestroyIcon
+
+ExtractIconExW.argtypes = [
+    wintypes.LPCWSTR, ctypes.c_int, ctypes.POINTER(wintypes.HICON),
+    ctypes.POINTER(wintypes.HICON), wintypes.UINT
+]
+ExtractIconExW.restype = wintypes.UINT
+DestroyIcon.argtypes = [wintypes.HICON]
+DestroyIcon.restype = wintypes.BOOL
+
+# EnumWindows callbacks are module-level thunks created once. Per-call state
+# is passed through LPARAM as a py_object rather than captured in a closure;
+# the caller's reference keeps it alive for the (synchronous) enumeration.
+def enum_state(lparam):
+    return ctypes.cast(lparam, ctypes.py_object).value
+
+
+# Titles are read into one reusable buffer per thread instead of a fresh
+# allocation per window; anything longer is truncated.
+TITLE_BUF_LEN = 512
+_enum_local = threading.local()
+
+
+def title_buffer():
+    buffer = getattr(_enum_local, 'title_buffer', None)
+    if buffer is None:
+        buffer = _enum_local.title_buffer = ctypes.create_unicode_buffer(TITLE_BUF_LEN)
+    return buffer
 
 
 def log(level, message):
@@ -76,40 +288,140 @@ def log(level, message):
         print(f"[LOG] {message}")
 
 
+def log_info(fmt, *args):
+    """Info-level log with %-style args, only formatted when info logging is on."""
+    if info_logging:
+        log(obs.LOG_INFO if IN_OBS else 0, fmt % args if args else fmt)
+
+
 def ensure_icons_dir():
     if not os.path.exists(ICONS_DIR):
         os.makedirs(ICONS_DIR)
 
 
+def is_exe_selector(selector):
+    """Whether a selector could match an exe name rather than only a title."""
+    return selector.lower().endswith('.exe') or (' ' not in selector and len(selector) <= 40)
+
+
+def build_selector_pattern():
+    global _selector_pattern, _exe_selector_pattern, _selector_to_game, _exe_name_to_group
+    global _has_exe_file_selectors
+
+    _selector_to_game = {}
+    exe_names = []
+    parts = []
+    exe_parts = []
+    for game in games_config.get("games", []):
+        selector = game.get("selector", "")
+        if selector and game.get("enabled", True):
+            group = f"g{len(parts)}"
+            _selector_to_game[group] = game
+            part = f"(?P<{group}>{re.escape(selector)})"
+            parts.append(part)
+            if is_exe_selector(selector):
+                exe_parts.append(part)
+                if selector.lower().endswith('.exe'):
+                    exe_names.append(selector.lower())
+
+    _selector_pattern = re.compile("|".join(parts), re.IGNORECASE) if parts else None
+    _exe_selector_pattern = re.compile("|".join(exe_parts), re.IGNORECASE) if exe_parts else None
+    _exe_name_to_group = {
+        name: _exe_selector_pattern.search(name).lastgroup for name in exe_names
+    }
+    _has_exe_file_selectors = bool(exe_names)
+
+
+def build_game_index():
+    global _games_by_selector, _selectors_lower
+
+    _games_by_selector = {
+        game.get("selector", "").lower(): game
+        for game in games_config.get("games", [])
+    }
+    _selectors_lower = frozenset(_games_by_selector)
+
+
 def load_config():
     global games_config
-    try:
-        if os.path.exists(CONFIG_PATH):
-            with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
-                games_config = json.load(f)
-                if "games" not in games_config:
-                    games_config["games"] = []
-        else:
+    with _config_lock:
+        try:
+            if os.path.exists(CONFIG_PATH):
+                st = os.stat(CONFIG_PATH)
+                stamp = (st.st_mtime_ns, st.st_size)
+                if stamp == _cfg_cache["stamp"] and _cfg_cache["data"] is not None:
+                    games_config = _cfg_cache["data"]
+                    return games_config
+
+                with open(CONFIG_PATH, 'rb') as f:
+                    games_config = json_loads(f.read())
+                    if "games" not in games_config:
+                        games_config["games"] = []
+                for game in games_config["games"]:
+                    icon_path = game.get("icon_path")
+                    game["_icon_resolved"] = bool(icon_path and os.path.exists(icon_path))
+                _cfg_cache["stamp"] = stamp
+                _cfg_cache["data"] = games_config
+                _cfg_cache["hash"] = config_digest(serialize_config())
+            else:
+                games_config = {"games": []}
+                save_config()
+        except Exception as e:
+            log(0, f"Error loading config: {e}")
             games_config = {"games": []}
-            save_config()
-    except Exception as e:
-        log(0, f"Error loading config: {e}")
-        games_config = {"games": []}
-    return games_config
+        build_game_index()
+        build_selector_pattern()
+        return games_config
+
+
+def public_config():
+    """games_config as written to disk - in-memory '_' keys are dropped."""
+    return {
+        **games_config,
+        "games": [
+            {k: v for k, v in game.items() if not k.startswith('_')}
+            for game in games_config.get("games", [])
+        ],
+    }
+
+
+def serialize_config():
+    return json_dumps(public_config())
+
+
+def config_digest(serialized):
+    return hashlib.blake2b(serialized, digest_size=8).digest()
 
 
 def save_config():
-    try:
-        with open(CONFIG_PATH, 'w', encoding='utf-8') as f:
-            json.dump(games_config, f, indent=2)
-    except Exception as e:
-        log(0, f"Error saving config: {e}")
+    with _config_lock:
+        try:
+            serialized = serialize_config()
+            digest = config_digest(serialized)
+            if digest == _cfg_cache["hash"] and os.path.exists(CONFIG_PATH):
+                _cfg_cache["data"] = games_config
+            else:
+                # Write to a temp file and swap it in, so a crash never leaves a
+                # half-written config behind
+                tmp = CONFIG_PATH + ".tmp"
+                with open(tmp, 'wb') as f:
+                    f.write(serialized)
+                os.replace(tmp, CONFIG_PATH)
+                st = os.stat(CONFIG_PATH)
+                _cfg_cache["stamp"] = (st.st_mtime_ns, st.st_size)
+                _cfg_cache["data"] = games_config
+                _cfg_cache["hash"] = digest
+        except Exception as e:
+            _cfg_cache["stamp"] = None
+            _cfg_cache["hash"] = None
+            log(0, f"Error saving config: {e}")
+        build_game_index()
+        build_selector_pattern()
 
 
 def add_game(name, selector, enabled=True):
-    for game in games_config.get("games", []):
-        if game.get("selector", "").lower() == selector.lower():
-            return False, "Game with this selector already exists"
+    if selector.lower() in _selectors_lower:
+        return False, "Game with this selector already exists"
 
     game = {
         "name": name,
@@ -123,14 +435,14 @@ def add_game(name, selector, enabled=True):
 
 
 def remove_game(selector):
-    for game in games_config.get("games", []):
-        if game.get("selector", "").lower() == selector.lower():
-            if game.get('icon_path') and os.path.exists(game.get('icon_path')):
-                try:
-                    os.remove(game.get('icon_path'))
-                except:
-                    pass
-            break
+    forget_icon_failures(selector)
+    game = _games_by_selector.get(selector.lower())
+    if game is not None:
+        if game.get('icon_path') and os.path.exists(game.get('icon_path')):
+            try:
+                os.remove(game.get('icon_path'))
+            except:
+                pass
 
     games_config["games"] = [
         g for g in games_config.get("games", [])
@@ -140,99 +452,171 @@ def remove_game(selector):
 
 
 def set_game_enabled(selector, enabled):
-    for game in games_config.get("games", []):
-        if game.get("selector", "").lower() == selector.lower():
-            game["enabled"] = enabled
-            save_config()
-            return True
-    return False
+    game = _games_by_selector.get(selector.lower())
+    if game is None:
+        return False
+    game["enabled"] = enabled
+    save_config()
+    return True
 
 
 # =============================================================================
 # Lightweight Process Detection using Windows API (no subprocess spawning)
 # =============================================================================
 
+class VisibleWindows(NamedTuple):
+    """Visible windows as parallel lists - one entry per window."""
+    titles: list
+    pids: list
+    hwnds: list
+
+
+def is_app_window(hwnd):
+    """
+    Whether a top-level window could be a game's main window: visible,
+    unowned and not a tool window. Callers check this before any title or
+    PID lookup.
+    """
+    return bool(IsWindowVisible(hwnd) and not GetWindow(hwnd, GW_OWNER)
+                and not GetWindowLongW(hwnd, GWL_EXSTYLE) & WS_EX_TOOLWINDOW)
+
+
+@EnumWindowsProc
+def _collect_windows_proc(hwnd, lparam):
+    titles, pids, hwnds, buffer = enum_state(lparam)
+    if is_app_window(hwnd):
+        # GetWindowTextW returns the copied length, so no separate
+        # GetWindowTextLengthW round trip to the owning thread.
+        length = GetWindowTextW(hwnd, buffer, TITLE_BUF_LEN)
+        if length > 0:
+            pid = wintypes.DWORD()
+            GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+            titles.append(buffer[:length])
+            pids.append(pid.value)
+            hwnds.append(hwnd)
+    return True
+
+
 def get_visible_windows():
     """
-    Get all visible windows with their titles and PIDs.
+    Get all visible, titled top-level app windows with their PIDs.
+    Owned popups and tool windows are skipped inside the callback.
     Uses direct Windows API calls - very lightweight.
-    Returns: list of {'title': str, 'pid': int}
+    Returns: VisibleWindows(titles, pids, hwnds)
     """
-    windows = []
-
-    def enum_callback(hwnd, lparam):
-        if IsWindowVisible(hwnd):
-            length = GetWindowTextLengthW(hwnd)
-            if length > 0:
-                buffer = ctypes.create_unicode_buffer(length + 1)
-                GetWindowTextW(hwnd, buffer, length + 1)
-                title = buffer.value
-
-                if title:  # Only windows with titles
-                    pid = wintypes.DWORD()
-                    GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
-                    windows.append({
-                        'title': title,
-                        'pid': pid.value,
-                        'hwnd': hwnd
-                    })
-        return True
-
-    EnumWindows(EnumWindowsProc(enum_callback), 0)
+    windows = VisibleWindows([], [], [])
+    EnumWindows(_collect_windows_proc, (*windows, title_buffer()))
     return windows
 
 
 def get_process_list():
     """
     Get list of running processes using Windows API.
-    Much lighter than WMIC/PowerShell.
+    One NtQuerySystemInformation call returns every process in a single
+    buffer, which is walked in place - no per-process handles. Still a
+    full-system query, so only used by the Detect button, never by the timer.
     Returns: dict of {pid: process_name}
     """
     processes = {}
 
-    snapshot = CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
-    if snapshot == -1:
+    size = 256 * 1024
+    while True:
+        buffer = ctypes.create_string_buffer(size)
+        needed = wintypes.ULONG(0)
+        status = NtQuerySystemInformation(
+            SYSTEM_PROCESS_INFORMATION_CLASS, buffer, size, ctypes.byref(needed)
+        ) & 0xFFFFFFFF
+        if status != STATUS_INFO_LENGTH_MISMATCH:
+            break
+        # Processes can start between calls - leave some headroom
+        size = max(size * 2, needed.value + 64 * 1024)
+
+    if status != 0:
         return processes
 
+    offset = 0
+    while True:
+        info = SYSTEM_PROCESS_INFORMATION.from_buffer(buffer, offset)
+        name = info.ImageName
+        pid = info.UniqueProcessId or 0  # the idle process has PID 0 (NULL)
+        processes[pid] = ctypes.wstring_at(name.Buffer, name.Length // 2).lower() if name.Buffer else ''
+
+        if not info.NextEntryOffset:
+            break
+        offset += info.NextEntryOffset
+
+    return processes
+
+
+def exe_path_for_pid(pid):
+    """Full exe path for a PID, or None if the process can't be queried."""
+    handle = OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return None
+
     try:
-        entry = PROCESSENTRY32W()
-        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
-
-        if Process32FirstW(snapshot, ctypes.byref(entry)):
-            while True:
-                processes[entry.th32ProcessID] = entry.szExeFile.lower()
-                if not Process32NextW(snapshot, ctypes.byref(entry)):
-                    break
+        buffer = ctypes.create_unicode_buffer(260)
+        size = wintypes.DWORD(260)
+        if QueryFullProcessImageNameW(handle, 0, buffer, ctypes.byref(size)):
+            return buffer.value
     finally:
-        CloseHandle(snapshot)
+        CloseHandle(handle)
 
-    return processes
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _exe_for_pid(pid, creation_time):
+    """
+    Lowercased exe name for a PID. creation_time is only part of the cache
+    key, so a reused PID (different creation time) misses the cache.
+    """
+    path = exe_path_for_pid(pid)
+    return os.path.basename(path).lower() if path else ''
+
+
+def _exe_name_for_pid(pid):
+    """
+    Resolve a single PID to its lowercased exe name.
+    Opens only that process instead of snapshotting the whole system, and
+    reuses earlier lookups while the same process instance is alive.
+    """
+    handle = OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return ''
+
+    try:
+        times = [wintypes.FILETIME() for _ in range(4)]
+        if not GetProcessTimes(handle, *(ctypes.byref(t) for t in times)):
+            return ''
+        creation_time = (times[0].dwHighDateTime << 32) | times[0].dwLowDateTime
+    finally:
+        CloseHandle(handle)
+
+    return _exe_for_pid(pid, creation_time)
 
 
 def get_processes_detailed():
     """
     Get detailed process info - lightweight version.
-    Only fetches what we need for matching.
+    Only fetches what we need for matching; 'name' stays None until
+    is_program_running needs it.
     """
-    windows = get_visible_windows()
-    processes_map = get_process_list()
+    titles, pids, hwnds = get_visible_windows()
 
     processes = []
     seen_pids = set()
 
-    for win in windows:
-        pid = win['pid']
+    for title, pid, hwnd in zip(titles, pids, hwnds):
         if pid in seen_pids:
             continue
         seen_pids.add(pid)
 
-        proc_name = processes_map.get(pid, '')
-
         processes.append({
-            'name': proc_name,
+            'name': None,
             'pid': pid,
-            'window_title': win['title'],
-            'hwnd': win['hwnd'],
+            'window_title': title,
+            'hwnd': hwnd,
             'command_line': ''  # Skip command line for performance
         })
 
@@ -249,47 +633,194 @@ def is_program_running(target_name, processes=None):
 
     target_lower = target_name.lower()
 
+    # Check window title (most reliable for games)
     for proc in processes:
-        # Check window title (most reliable for games)
         if target_lower in proc['window_title'].lower():
             return True, proc
 
-        # Check process name
+    if not is_exe_selector(target_name):
+        return False, None
+
+    # Check process name, resolving it per PID only now
+    for proc in processes:
+        if proc['name'] is None:
+            proc['name'] = _exe_name_for_pid(proc['pid'])
         if target_lower in proc['name']:
             return True, proc
 
     return False, None
 
 
-def check_any_game_running(processes=None):
-    """Check if any enabled game is running."""
-    if processes is None:
-        processes = get_processes_detailed()
+@EnumWindowsProc
+def _match_windows_proc(hwnd, lparam):
+    search, fallback, result, buffer = enum_state(lparam)
+    if is_app_window(hwnd):
+        length = GetWindowTextW(hwnd, buffer, TITLE_BUF_LEN)
+        if length > 0:
+            m = search(buffer[:length])
+            if m is None and fallback is None:
+                return True
 
-    for game in games_config.get("games", []):
-        if not game.get("enabled", True):
-            continue
+            pid = wintypes.DWORD()
+            GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
 
-        selector = game.get("selector", "")
-        if selector:
-            is_running, proc = is_program_running(selector, processes)
+            if m is None:
+                if pid.value not in fallback:
+                    fallback[pid.value] = (hwnd, buffer[:length])
+                return True
+
+            result.append((m.lastgroup, {
+                'name': '',
+                'pid': pid.value,
+                'window_title': m.string,
+                'hwnd': hwnd,
+                'command_line': ''
+            }))
+            return False
+    return True
+
+
+def find_first_selector_match(pattern, fallback=None):
+    """
+    Enumerate visible windows, running the compiled selector pattern over
+    each title inside the EnumWindows callback, and stop at the first match.
+    Non-matching windows are never collected, except that the first window
+    of each PID is recorded in `fallback` as {pid: (hwnd, title)} when a
+    dict is passed, for the process-name fallback.
+    Returns: (group, proc) or (None, None)
+    """
+    result = []
+    EnumWindows(_match_windows_proc, (pattern.search, fallback, result, title_buffer()))
+    return result[0] if result else (None, None)
+
+
+def foreground_match(pattern):
+    """
+    Check only the foreground window's title - usually where a running game
+    is - before paying for a full EnumWindows walk.
+    Returns: (group, proc) or (None, None)
+    """
+    hwnd = GetForegroundWindow()
+    if not hwnd or not is_app_window(hwnd):
+        return None, None
+
+    buffer = title_buffer()
+    length = GetWindowTextW(hwnd, buffer, TITLE_BUF_LEN)
+    if length <= 0:
+        return None, None
+
+    m = pattern.search(buffer[:length])
+    if not m:
+        return None, None
+
+    pid = wintypes.DWORD()
+    GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+    return m.lastgroup, {
+        'name': None,
+        'pid': pid.value,
+        'window_title': m.string,
+        'hwnd': hwnd,
+        'command_line': ''
+    }
+
+
+def match_exe_name(exe_pattern, name):
+    """Group of the selector matching an exe name, or None."""
+    group = _exe_name_to_group.get(name)
+    if group is None:
+        m = exe_pattern.search(name)
+        group = m.lastgroup if m else None
+    return group
+
+
+def check_any_game_running(processes=None):
+    """Check if any enabled game is running."""
+    if processes is not None:
+        for game in _selector_to_game.values():
+            is_running, proc = is_program_running(game["selector"], processes)
             if is_running:
-                try_extract_icon_for_game(game, proc)
+                queue_icon_extraction(game, proc)
                 return game, proc
+        return None, None
+
+    pattern = _selector_pattern
+    if pattern is None:
+        return None, None
+
+    exe_pattern = _exe_selector_pattern
+    fallback = {} if exe_pattern is not None else None
+    group, proc = foreground_match(pattern)
+    if group is None:
+        group, proc = find_first_selector_match(pattern, fallback)
+
+    # Exe names are only resolved when no title matched, some selector looks
+    # like an exe name, and then only for the PIDs that own visible windows.
+    if group is None and fallback:
+        for pid, (hwnd, title) in fallback.items():
+            name = _exe_name_for_pid(pid)
+            group = match_exe_name(exe_pattern, name)
+            if group:
+                proc = {
+                    'name': name,
+                    'pid': pid,
+                    'window_title': title,
+                    'hwnd': hwnd,
+                    'command_line': ''
+                }
+                break
+
+    game = _selector_to_game.get(group) if group else None
+    if game is None:
+        return None, None
 
-    return None, None
+    queue_icon_extraction(game, proc)
+    return game, proc
 
 
 # =============================================================================
 # Icon Extraction (only runs once per game, not in hot path)
 # =============================================================================
 
+def save_icon_png(icon_handle, output_path):
+    """Draw an HICON into a bitmap and save it as PNG (needs PIL and pywin32)."""
+    from PIL import Image
+    import win32gui
+    import win32ui
+
+    icon_info = win32gui.GetIconInfo(icon_handle)
+    bmp_handle = icon_info[4]
+    if not bmp_handle:
+        return False
+
+    bmp = win32ui.CreateBitmapFromHandle(bmp_handle)
+    bmp_info = bmp.GetInfo()
+    width = bmp_info['bmWidth']
+    height = bmp_info['bmHeight']
+
+    hwnd_dc = win32gui.GetDC(0)
+    dc = win32ui.CreateDCFromHandle(hwnd_dc)
+    mem_dc = dc.CreateCompatibleDC()
+
+    new_bmp = win32ui.CreateBitmap()
+    new_bmp.CreateCompatibleBitmap(dc, width, height)
+    old_bmp = mem_dc.SelectObject(new_bmp)
+    mem_dc.DrawIcon((0, 0), icon_handle)
+
+    bmp_str = new_bmp.GetBitmapBits(True)
+    img = Image.frombuffer('RGBA', (width, height), bmp_str, 'raw', 'BGRA', 0, 1)
+    img.save(output_path, 'PNG')
+
+    mem_dc.SelectObject(old_bmp)
+    mem_dc.DeleteDC()
+    dc.DeleteDC()
+    win32gui.ReleaseDC(0, hwnd_dc)
+    return True
+
+
 def extract_icon_from_window(hwnd, output_path):
     """Extract icon from a window handle."""
     try:
-        from PIL import Image
         import win32gui
-        import win32ui
         import win32con
 
         icon_handle = win32gui.SendMessage(hwnd, win32con.WM_GETICON, win32con.ICON_BIG, 0)
@@ -301,33 +832,7 @@ def extract_icon_from_window(hwnd, output_path):
             icon_handle = win32gui.GetClassLong(hwnd, win32con.GCL_HICONSM)
 
         if icon_handle:
-            icon_info = win32gui.GetIconInfo(icon_handle)
-            bmp_handle = icon_info[4]
-
-            if bmp_handle:
-                bmp = win32ui.CreateBitmapFromHandle(bmp_handle)
-                bmp_info = bmp.GetInfo()
-                width = bmp_info['bmWidth']
-                height = bmp_info['bmHeight']
-
-                hwnd_dc = win32gui.GetDC(0)
-                dc = win32ui.CreateDCFromHandle(hwnd_dc)
-                mem_dc = dc.CreateCompatibleDC()
-
-                new_bmp = win32ui.CreateBitmap()
-                new_bmp.CreateCompatibleBitmap(dc, width, height)
-                old_bmp = mem_dc.SelectObject(new_bmp)
-                mem_dc.DrawIcon((0, 0), icon_handle)
-
-                bmp_str = new_bmp.GetBitmapBits(True)
-                img = Image.frombuffer('RGBA', (width, height), bmp_str, 'raw', 'BGRA', 0, 1)
-                img.save(output_path, 'PNG')
-
-                mem_dc.SelectObject(old_bmp)
-                mem_dc.DeleteDC()
-                dc.DeleteDC()
-                win32gui.ReleaseDC(0, hwnd_dc)
-                return True
+            return save_icon_png(icon_handle, output_path)
 
     except ImportError:
         pass
@@ -337,46 +842,406 @@ def extract_icon_from_window(hwnd, output_path):
     return False
 
 
+def extract_icon_from_exe(exe_path, output_path):
+    """
+    Extract the first large icon embedded in an executable. Fallback for
+    games whose windows don't expose an icon (borderless/fullscreen).
+    """
+    large = wintypes.HICON()
+    if not ExtractIconExW(exe_path, 0, ctypes.byref(large), None, 1) or not large.value:
+        return False
+
+    try:
+        return save_icon_png(large.value, output_path)
+    except ImportError:
+        pass
+    except Exception as e:
+        log(0, f"Error extracting icon from {exe_path}: {e}")
+    finally:
+        DestroyIcon(large)
+
+    return False
+
+
+# Failed extractions, keyed on (selector, exe_path, exe_mtime_ns) - the same
+# binary isn't retried on every detection, only once it has been updated.
+_icon_failures = set()
+
+
+def icon_attempt_key(game, proc):
+    path = exe_path_for_pid(proc['pid']) or ''
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns if path else 0
+    except OSError:
+        mtime_ns = 0
+    return (game.get('selector', '').lower(), path, mtime_ns)
+
+
+def forget_icon_failures(selector):
+    selector = selector.lower()
+    for key in [k for k in _icon_failures if k[0] == selector]:
+        _icon_failures.discard(key)
+
+
 def try_extract_icon_for_game(game, proc):
     """Try to extract icon (only if we don't have one)."""
-    if game.get("icon_path") and os.path.exists(game.get("icon_path")):
+    if game.get("_icon_resolved"):
+        return
+
+    key = icon_attempt_key(game, proc)
+    if key in _icon_failures:
         return
 
     ensure_icons_dir()
-    safe_name = re.sub(r'[^\w\-]', '_', game['name'])
+    safe_name = _SAFE_NAME_RE.sub('_', game['name'])
     icon_path = os.path.join(ICONS_DIR, f"{safe_name}.png")
 
+    # The attempt key already carries the exe path, resolved with a single
+    # OpenProcess/QueryFullProcessImageNameW round trip
     hwnd = proc.get('hwnd')
-    if hwnd and extract_icon_from_window(hwnd, icon_path):
+    exe_path = key[1]
+    if ((hwnd and extract_icon_from_window(hwnd, icon_path))
+            or (exe_path and extract_icon_from_exe(exe_path, icon_path))):
         game['icon_path'] = icon_path
+        game['_icon_resolved'] = True
         save_config()
-        log(0 if not IN_OBS else obs.LOG_INFO, f"Extracted icon for {game['name']}")
+        log_info("Extracted icon for %s", game['name'])
+    else:
+        _icon_failures.add(key)
+
+
+# Extraction pulls in PIL/pywin32 and draws through GDI, so detection only
+# hands (game, proc) to a single background worker.
+_icon_queue = queue.Queue()
+_icon_worker = None
+_icons_pending = set()
+
+
+def icon_worker():
+    while True:
+        item = _icon_queue.get()
+        if item is None:
+            break
+
+        game, proc = item
+        try:
+            try_extract_icon_for_game(game, proc)
+        except Exception as e:
+            log(0, f"Error extracting icon: {e}")
+        finally:
+            _icons_pending.discard(game.get('selector', ''))
+
+
+def queue_icon_extraction(game, proc):
+    """Queue icon extraction for a game without blocking the caller."""
+    global _icon_worker
+
+    if game.get("_icon_resolved"):
+        return
+
+    selector = game.get('selector', '')
+    if selector in _icons_pending:
+        return
+    _icons_pending.add(selector)
+
+    if _icon_worker is None or not _icon_worker.is_alive():
+        _icon_worker = threading.Thread(target=icon_worker, daemon=True)
+        _icon_worker.start()
+
+    _icon_queue.put((game, proc))
+
+
+def stop_icon_worker():
+    global _icon_worker
+
+    if _icon_worker is not None and _icon_worker.is_alive():
+        _icon_queue.put(None)
+    _icon_worker = None
+
+
+# =============================================================================
+# Event-driven detection (WinEvent hook + process-exit wait)
+# =============================================================================
+
+# A window coming to the foreground or being shown, and the recorded game's
+# process exiting, all arrive as OS notifications, so the timer only does a
+# full window walk as a time-based safety net (hook failures, missed events).
+SAFETY_SCAN_SECONDS = 30
+HOOKED_EVENTS = (EVENT_SYSTEM_FOREGROUND, EVENT_OBJECT_SHOW)
+
+_hook_thread = None
+_hook_thread_id = None
+_foreground_hit = None            # (group, proc) from the last matching window event
+_hit_lock = threading.Lock()      # hook thread sets the hit, the timer swaps it out
+_exit_event = threading.Event()    # set when the recorded game's process exits
+_exit_wait = None                 # (wait handle, process handle)
+_last_full_scan = None            # monotonic time of the last full walk; None forces one
+
+
+@WinEventProc
+def _window_event_proc(hook, event, hwnd, id_object, id_child, thread_id, event_time):
+    global _foreground_hit
+
+    pattern = _selector_pattern
+    if pattern is None or id_object != OBJID_WINDOW or id_child != CHILDID_SELF or not hwnd:
+        return
+    # Only top-level windows - SHOW also fires for every child control
+    if GetAncestor(hwnd, GA_ROOT) != hwnd:
+        return
+    if not is_app_window(hwnd):
+        return
+
+    buffer = title_buffer()
+    length = GetWindowTextW(hwnd, buffer, TITLE_BUF_LEN)
+    if length <= 0:
+        return
+
+    m = pattern.search(buffer[:length])
+    if m:
+        pid = wintypes.DWORD()
+        GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+        hit = (m.lastgroup, {
+            'name': '',
+            'pid': pid.value,
+            'window_title': m.string,
+            'hwnd': hwnd,
+            'command_line': ''
+        })
+        with _hit_lock:
+            _foreground_hit = hit
+
+
+def hook_thread_main():
+    """Own the window-event hooks and pump their messages until WM_QUIT."""
+    global _hook_thread_id
+    _hook_thread_id = GetCurrentThreadId()
+
+    # One hook per event - a single FOREGROUND..SHOW range would also take
+    # in every system and object event between them
+    hooks = []
+    for event in HOOKED_EVENTS:
+        hook = SetWinEventHook(
+            event, event, None, _window_event_proc,
+            0, 0, WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS
+        )
+        if not hook:
+            break
+        hooks.append(hook)
+
+    try:
+        if len(hooks) < len(HOOKED_EVENTS):
+            log(0, "Window event hooks unavailable - falling back to polling")
+            return
+
+        msg = wintypes.MSG()
+        while GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+            TranslateMessage(ctypes.byref(msg))
+            DispatchMessageW(ctypes.byref(msg))
+    finally:
+        for hook in hooks:
+            UnhookWinEvent(hook)
+        _hook_thread_id = None
+
+
+def start_event_hooks():
+    global _hook_thread
+
+    if _hook_thread is not None and _hook_thread.is_alive():
+        return
+    _hook_thread = threading.Thread(target=hook_thread_main, daemon=True)
+    _hook_thread.start()
+
+
+def stop_event_hooks():
+    global _hook_thread
+
+    if _hook_thread_id is not None:
+        PostThreadMessageW(_hook_thread_id, WM_QUIT, 0, 0)
+    _hook_thread = None
+    unwatch_game_exit()
+
+
+def hooks_active():
+    return _hook_thread is not None and _hook_thread_id is not None
+
+
+@WaitOrTimerCallback
+def _game_exit_proc(context, timed_out):
+    _exit_event.set()
+
+
+def watch_game_exit(pid):
+    """Get notified (via _exit_event) when the recorded game's process exits."""
+    global _exit_wait
+
+    unwatch_game_exit()
+    _exit_event.clear()
+
+    process = OpenProcess(SYNCHRONIZE, False, pid)
+    if not process:
+        return
+
+    wait = wintypes.HANDLE()
+    if RegisterWaitForSingleObject(
+        ctypes.byref(wait), process, _game_exit_proc, None, INFINITE, WT_EXECUTEONLYONCE
+    ):
+        _exit_wait = (wait, process)
+    else:
+        CloseHandle(process)
+
+
+def unwatch_game_exit():
+    global _exit_wait
+
+    if _exit_wait is not None:
+        wait, process = _exit_wait
+        # Blocks until the thread-pool wait is gone, so it can't still be
+        # waiting on the process handle when it is closed
+        UnregisterWaitEx(wait, INVALID_HANDLE_VALUE)
+        CloseHandle(process)
+        _exit_wait = None
+
+
+def take_foreground_hit():
+    """The game whose window a hook saw come forward or appear, if any."""
+    global _foreground_hit
+
+    with _hit_lock:
+        hit, _foreground_hit = _foreground_hit, None
+    if hit is None:
+        return None, None
+
+    group, proc = hit
+    game = _selector_to_game.get(group)
+    if game is None or not IsWindow(proc['hwnd']):
+        return None, None
+    return game, proc
+
+
+def full_scan_due():
+    """Whether the timer has to walk all windows instead of trusting the hooks.
+
+    Selectors ending in ".exe" never appear in a title, so the hooks can't
+    see them and the walk runs every tick. Other no-space selectors are
+    usually window titles too; a game whose title doesn't contain one waits
+    for the next safety scan.
+    """
+    if _has_exe_file_selectors or _last_full_scan is None:
+        return True
+    return time.monotonic() - _last_full_scan >= SAFETY_SCAN_SECONDS
 
 
 # =============================================================================
 # OBS Script Interface
 # =============================================================================
 
+def game_window_alive():
+    """
+    Cheap check that the game being recorded is still up: its window
+    still exists and is owned by the same PID. Lets the timer skip the
+    full window walk while recording.
+    """
+    if current_game_hwnd is None:
+        return False
+
+    # Game was disabled or removed - take the full path to stop recording
+    if not any(g is current_game for g in _selector_to_game.values()):
+        return False
+
+    if not IsWindow(current_game_hwnd):
+        return False
+
+    pid = wintypes.DWORD()
+    GetWindowThreadProcessId(current_game_hwnd, ctypes.byref(pid))
+    return pid.value == current_game_pid
+
+
+# Adaptive polling: the timer starts at check_interval, doubles every
+# IDLE_BACKOFF_TICKS quiet ticks up to max_interval, and drops to
+# min_interval while recording so a closed game is noticed quickly. Only
+# ticks that walked all windows and found nothing count as quiet; a tick
+# that just read the hooks' hit costs nothing, and a slower timer would only
+# delay acting on it.
+IDLE_BACKOFF_TICKS = 5
+_cur_interval = None
+_idle_streak = 0
+_prev_intervals = None  # (check, min, max) the timer was last configured for
+
+
+def set_poll_interval(interval):
+    """Reinstall the timer at a new period (no-op if unchanged)."""
+    global _cur_interval
+    if interval == _cur_interval:
+        return
+    obs.timer_remove(check_program_callback)
+    obs.timer_add(check_program_callback, interval)
+    _cur_interval = interval
+
+
+def note_idle_tick():
+    global _idle_streak
+    _idle_streak += 1
+    if (_idle_streak % IDLE_BACKOFF_TICKS == 0 and _cur_interval is not None
+            and _cur_interval < max_interval):
+        set_poll_interval(min(_cur_interval * 2, max_interval))
+
+
 def check_program_callback():
     """Timer callback - lightweight check."""
-    global is_recording_for_game, current_game
+    global is_recording_for_game, current_game, current_game_hwnd, current_game_pid
+    global _last_full_scan, _idle_streak
+
+    if is_recording_for_game and not _exit_event.is_set() and game_window_alive():
+        return
+
+    game, proc = None, None
+    if not is_recording_for_game and hooks_active():
+        game, proc = take_foreground_hit()
+        if game is None and not full_scan_due():
+            # No window event matched - only walk windows now and then
+            return
 
-    game, proc = check_any_game_running()
+    if game is None:
+        _last_full_scan = time.monotonic()
+        game, proc = check_any_game_running()
+    else:
+        queue_icon_extraction(game, proc)
     recording_active = obs.obs_frontend_recording_active()
 
     if game and not recording_active and not is_recording_for_game:
         proc_info = proc['window_title'] or proc['name']
-        log(obs.LOG_INFO, f"Detected '{game['name']}' ({proc_info}) - Starting recording")
+        log_info("Detected '%s' (%s) - Starting recording", game['name'], proc_info)
         obs.obs_frontend_recording_start()
         is_recording_for_game = True
         current_game = game
+        current_game_hwnd = proc['hwnd']
+        current_game_pid = proc['pid']
+        watch_game_exit(proc['pid'])
+        _idle_streak = 0
+        set_poll_interval(min_interval)
+
+    elif game and is_recording_for_game:
+        # Still running under a different window - track that one instead
+        current_game = game
+        current_game_hwnd = proc['hwnd']
+        if proc['pid'] != current_game_pid:
+            current_game_pid = proc['pid']
+            watch_game_exit(proc['pid'])
 
     elif not game and is_recording_for_game:
         game_name = current_game['name'] if current_game else "game"
-        log(obs.LOG_INFO, f"'{game_name}' closed - Stopping recording")
+        log_info("'%s' closed - Stopping recording", game_name)
         obs.obs_frontend_recording_stop()
         is_recording_for_game = False
         current_game = None
+        current_game_hwnd = None
+        current_game_pid = None
+        unwatch_game_exit()
+        _idle_streak = 0
+        set_poll_interval(check_interval)
+
+    elif not game:
+        note_idle_tick()
 
 
 def on_add_game_clicked(props, prop):
@@ -401,18 +1266,24 @@ def on_add_game_clicked(props, prop):
     success, message = add_game(name, selector, enabled=True)
 
     if success:
-        log(obs.LOG_INFO, f"Added game: {name} (selector: {selector})")
+        log_info("Added game: %s (selector: %s)", name, selector)
         obs.obs_data_set_string(current_settings, "new_game_name", "")
         obs.obs_data_set_string(current_settings, "new_game_selector", "")
 
-        # Try to extract icon
-        processes = get_processes_detailed()
-        is_running, proc = is_program_running(selector, processes)
-        if is_running:
-            for g in games_config.get('games', []):
-                if g['selector'] == selector:
-                    try_extract_icon_for_game(g, proc)
-                    break
+        # Try to extract icon, reusing the window Detect found if it still
+        # matches instead of enumerating again
+        proc = detected_proc(selector)
+        is_running = proc is not None
+        if not is_running:
+            is_running, proc = is_program_running(selector, get_processes_detailed())
+        game = _games_by_selector.get(selector.lower())
+        if is_running and game is not None:
+            queue_icon_extraction(game, proc)
+
+        # The stashed window belongs to the game just added
+        obs.obs_data_set_string(current_settings, "_detected_title", "")
+        obs.obs_data_set_int(current_settings, "_detected_pid", 0)
+        obs.obs_data_set_int(current_settings, "_detected_hwnd", 0)
     else:
         log(obs.LOG_WARNING, f"Failed: {message}")
 
@@ -429,64 +1300,112 @@ def on_remove_game_clicked(props, prop):
 
     if selector and selector != "":
         load_config()
-        game_name = None
-        for game in games_config.get('games', []):
-            if game['selector'] == selector:
-                game_name = game['name']
-                break
+        game = _games_by_selector.get(selector.lower())
 
         remove_game(selector)
-        if game_name:
-            log(obs.LOG_INFO, f"Removed game: {game_name}")
+        if game is not None:
+            log_info("Removed game: %s", game['name'])
 
     return True
 
 
+def remember_detected(title, pid, hwnd):
+    """Stash the detected window in hidden settings for the Add button."""
+    obs.obs_data_set_string(current_settings, "new_game_selector", title)
+    obs.obs_data_set_string(current_settings, "_detected_title", title)
+    obs.obs_data_set_int(current_settings, "_detected_pid", pid)
+    obs.obs_data_set_int(current_settings, "_detected_hwnd", hwnd or 0)
+
+
+def detected_proc(selector):
+    """
+    Process dict for the window Detect last found, if the selector still
+    matches its title and the window is still owned by the same PID.
+    """
+    title = obs.obs_data_get_string(current_settings, "_detected_title")
+    pid = obs.obs_data_get_int(current_settings, "_detected_pid")
+    hwnd = obs.obs_data_get_int(current_settings, "_detected_hwnd")
+    if not title or not hwnd or selector.lower() not in title.lower():
+        return None
+
+    if not IsWindow(hwnd):
+        return None
+    owner = wintypes.DWORD()
+    GetWindowThreadProcessId(hwnd, ctypes.byref(owner))
+    if owner.value != pid:
+        return None
+
+    return {
+        'name': None,
+        'pid': pid,
+        'window_title': title,
+        'hwnd': hwnd,
+        'command_line': ''
+    }
+
+
 def on_detect_running_clicked(props, prop):
     global current_settings
 
     if current_settings is None:
         return False
 
-    windows = get_visible_windows()
-
-    # Filter out common system windows
-    system_titles = ['program manager', 'settings', 'task manager', 'obs']
-    system_procs = ['explorer.exe', 'cmd.exe', 'powershell.exe', 'code.exe',
-                   'chrome.exe', 'firefox.exe', 'msedge.exe', 'obs64.exe', 'obs32.exe',
-                   'searchhost.exe', 'textinputhost.exe', 'shellexperiencehost.exe']
-
+    titles, pids, hwnds = get_visible_windows()
     processes_map = get_process_list()
 
-    for win in windows:
-        proc_name = processes_map.get(win['pid'], '')
-        title_lower = win['title'].lower()
-
+    for title, pid, hwnd in zip(titles, pids, hwnds):
         # Skip system windows
-        if proc_name in system_procs:
+        if processes_map.get(pid, '') in _SYS_PROCS:
             continue
-        if any(s in title_lower for s in system_titles):
+        if _SYS_TITLE_RE.search(title.lower()):
             continue
 
-        obs.obs_data_set_string(current_settings, "new_game_selector", win['title'])
-        log(obs.LOG_INFO, f"Detected: {win['title']}")
+        remember_detected(title, pid, hwnd)
+        log_info("Detected: %s", title)
         return True
 
-    if windows:
-        obs.obs_data_set_string(current_settings, "new_game_selector", windows[0]['title'])
-        log(obs.LOG_INFO, f"Detected: {windows[0]['title']}")
+    if titles:
+        remember_detected(titles[0], pids[0], hwnds[0])
+        log_info("Detected: %s", titles[0])
     else:
         log(obs.LOG_WARNING, "No windows detected")
 
     return True
 
 
-def on_game_checkbox_changed(props, prop, settings):
-    for game in games_config.get("games", []):
-        setting_name = f"game_enabled_{game['selector']}"
-        game['enabled'] = obs.obs_data_get_bool(settings, setting_name)
+def deferred_save():
+    """One-shot timer: write the config once a burst of UI changes settles."""
+    global _save_pending
+    obs.remove_current_callback()
+    _save_pending = False
     save_config()
-    return True
+
+
+def schedule_save():
+    global _save_pending
+    obs.timer_remove(deferred_save)
+    obs.timer_add(deferred_save, 500)
+    _save_pending = True
+
+
+def flush_pending_save():
+    global _save_pending
+    if _save_pending:
+        obs.timer_remove(deferred_save)
+        _save_pending = False
+        save_config()
+
+
+def on_game_checkbox_changed(props, prop, settings):
+    # Only the toggled checkbox's game is touched; nothing else in the
+    # properties view depends on it, so no refresh is requested
+    setting_name = obs.obs_property_name(prop)
+    game = _games_by_selector.get(setting_name[len("game_enabled_"):].lower())
+    if game is None:
+        return False
+    game['enabled'] = obs.obs_data_get_bool(settings, setting_name)
+    schedule_save()
+    return False
 
 
 def populate_remove_dropdown(prop):
@@ -514,6 +1433,23 @@ Automatically starts recording when games are running.
 """
 
 
+def game_property_rows():
+    """Checkbox (setting name, label) pairs for the configured games."""
+    global _props_rows_key, _props_rows
+
+    games = games_config.get("games", [])
+    key = tuple((g['selector'], g['name'], g.get('_icon_resolved', False)) for g in games)
+    if key != _props_rows_key:
+        rows = []
+        for game in games:
+            label = game['name']
+            if game.get('_icon_resolved'):
+                label += " ★"
+            rows.append((f"game_enabled_{game['selector']}", label))
+        _props_rows_key, _props_rows = key, rows
+    return _props_rows
+
+
 def script_properties():
     load_config()
     props = obs.obs_properties_create()
@@ -521,6 +1457,13 @@ def script_properties():
     obs.obs_properties_add_int(
         props, "check_interval", "Check Interval (ms)", 1000, 30000, 500
     )
+    obs.obs_properties_add_int(
+        props, "min_interval", "Interval While Recording (ms)", 250, 5000, 250
+    )
+    obs.obs_properties_add_int(
+        props, "max_interval", "Max Idle Interval (ms)", 1000, 60000, 1000
+    )
+    obs.obs_properties_add_bool(props, "info_logging", "Log detections and changes")
 
     # Add Game Section
     obs.obs_properties_add_text(props, "section_add", "─── Add New Game ───", obs.OBS_TEXT_INFO)
@@ -548,11 +1491,7 @@ def script_properties():
     if not games_config.get("games"):
         obs.obs_properties_add_text(props, "no_games", "No games configured yet.", obs.OBS_TEXT_INFO)
     else:
-        for game in games_config.get("games", []):
-            setting_name = f"game_enabled_{game['selector']}"
-            label = game['name']
-            if game.get('icon_path') and os.path.exists(game.get('icon_path')):
-                label += " ★"
+        for setting_name, label in game_property_rows():
             checkbox = obs.obs_properties_add_bool(props, setting_name, label)
             obs.obs_property_set_modified_callback(checkbox, on_game_checkbox_changed)
 
@@ -567,6 +1506,9 @@ def script_properties():
 
 def script_defaults(settings):
     obs.obs_data_set_default_int(settings, "check_interval", 3000)
+    obs.obs_data_set_default_int(settings, "min_interval", 500)
+    obs.obs_data_set_default_int(settings, "max_interval", 8000)
+    obs.obs_data_set_default_bool(settings, "info_logging", True)
     obs.obs_data_set_default_string(settings, "new_game_name", "")
     obs.obs_data_set_default_string(settings, "new_game_selector", "")
 
@@ -577,31 +1519,63 @@ def script_defaults(settings):
 
 
 def script_update(settings):
-    global check_interval, current_settings
+    global check_interval, min_interval, max_interval, info_logging, current_settings
+    global _last_full_scan, _idle_streak, _prev_intervals
 
     current_settings = settings
-    check_interval = obs.obs_data_get_int(settings, "check_interval")
+    info_logging = obs.obs_data_get_bool(settings, "info_logging")
 
+    # A zero or negative period would have OBS fire the timer every frame
+    check_interval = obs.obs_data_get_int(settings, "check_interval")
+    if check_interval <= 0:
+        check_interval = 3000
+    min_interval = min(obs.obs_data_get_int(settings, "min_interval"), check_interval)
+    if min_interval <= 0:
+        min_interval = min(500, check_interval)
+    max_interval = max(obs.obs_data_get_int(settings, "max_interval"), check_interval)
+
+    # OBS calls this after every property change, checkbox toggles included,
+    # so only games whose setting differs are touched and the write goes
+    # through the deferred save
     load_config()
+    changed = False
     for game in games_config.get("games", []):
-        setting_name = f"game_enabled_{game['selector']}"
-        game['enabled'] = obs.obs_data_get_bool(settings, setting_name)
-    save_config()
-
-    obs.timer_remove(check_program_callback)
-    obs.timer_add(check_program_callback, check_interval)
+        enabled = obs.obs_data_get_bool(settings, f"game_enabled_{game['selector']}")
+        if enabled != game.get('enabled', True):
+            game['enabled'] = enabled
+            changed = True
+    if changed:
+        schedule_save()
+        # Games may have been enabled that are already running
+        _last_full_scan = None
+
+    # Settings refreshes that leave the intervals alone keep the running
+    # timer (and any idle backoff) as is
+    intervals = (check_interval, min_interval, max_interval)
+    if intervals != _prev_intervals or _cur_interval is None:
+        _idle_streak = 0
+        set_poll_interval(min_interval if is_recording_for_game else check_interval)
+        _prev_intervals = intervals
 
     enabled_count = sum(1 for g in games_config.get("games", []) if g.get('enabled', True))
-    log(obs.LOG_INFO, f"Monitoring {enabled_count} game(s) every {check_interval}ms")
+    log_info("Monitoring %d game(s) every %dms (idle backoff up to %dms)",
+             enabled_count, check_interval, max_interval)
 
 
 def script_load(settings):
     global current_settings
     current_settings = settings
     load_config()
-    log(obs.LOG_INFO, "Game Auto-Recorder loaded (lightweight mode)")
+    start_event_hooks()
+    log_info("Game Auto-Recorder loaded (lightweight mode)")
 
 
 def script_unload():
+    global _cur_interval, _prev_intervals
     obs.timer_remove(check_program_callback)
-    log(obs.LOG_INFO, "Game Auto-Recorder unloaded")
+    _cur_interval = None
+    _prev_intervals = None
+    flush_pending_save()
+    stop_event_hooks()
+    stop_icon_worker()
+    log_info("Game Auto-Recorder unloaded")